@@ -4,6 +4,7 @@ of instruments, experiments and devices. The objects defined here are
 designed to be "hashable", i.e., easy to store and share.
 """
 
+import json
 import jsonpickle
 from collections.abc import MutableSequence, Mapping
 
@@ -98,6 +99,14 @@ class Hashable(object):
         jsonpickle.set_encoder_options('json', sort_keys=True, indent=4)
         return jsonpickle.json.encode(json_state)
 
+    def _toJSONfile(self, fx):
+        ''' Same output as :meth:`_toJSON`, but streamed into an open
+            file object instead of materializing the full string first.
+        '''
+        context = jsonpickle.pickler.Pickler(unpicklable=True, warn=True)
+        json_state = context.flatten(self, reset=True)
+        json.dump(json_state, fx, sort_keys=True, indent=4)
+
 
 class Node(Hashable):
     """
@@ -8,25 +8,41 @@ from .paths import (projectDir,  # noqa
 
 fileDir = dataHome  # Set this in your experiment
 
+# Resolved form of fileDir. resolve() stats every path component, so it
+# is done once and remembered; the entry is invalidated whenever the
+# user reassigns io.fileDir, which is checked on every access
+_fileDirCache = (None, None)
 
-def _getFileDir(childFile=None):
+
+def _getFileDir(childFile=None, resolve=True):
     ''' This is only used within this package.
         The idea is to create a dynamic link to this changing attribute
 
         Args:
             childFile (str): Instead of the directory, will return
             the resolved path to this file within the directory
+            resolve (bool): whether to fully resolve symlinks, which
+            costs a stat per path component. Paths that are only
+            handed to open() can skip it; the kernel walks the path anyway
     '''
-    if childFile is None:
-        return Path(fileDir).resolve()
+    global _fileDirCache
+    if resolve:
+        if _fileDirCache[0] != fileDir:
+            _fileDirCache = (fileDir, Path(fileDir).resolve())
+        base = _fileDirCache[1]
     else:
-        return (Path(fileDir) / childFile).resolve()
+        base = Path(fileDir)
+    if childFile is None:
+        return base
+    return base / childFile
 
 from .saveload import (pprintFileDir,  # noqa
                        savePickle,  # noqa
                        loadPickle,  # noqa
                        loadPickleGzip,  # noqa
                        savePickleGzip,  # noqa
+                       loadPickleFast,  # noqa
+                       savePickleFast,  # noqa
                        saveMat,  # noqa
                        loadMat,  # noqa
                        saveFigure)  # noqa
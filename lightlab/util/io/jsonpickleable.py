@@ -2,16 +2,64 @@
 
     Tested in :mod:`tests.test_JSONpickleable`.
 '''
-import dill
-import jsonpickle
-import jsonpickle.ext.numpy as jsonpickle_numpy
-jsonpickle_numpy.register_handlers()
-
 from lightlab import logger
 from lightlab.laboratory import Hashable
 from .saveload import _endingWith, _makeFileExist
 from . import _getFileDir
 
+# dill and the jsonpickle numpy handlers are only needed once somebody
+# actually serializes a JSONpickleable, so defer those imports and the
+# handler registration out of module import time
+dill = None
+jsonpickle = None
+_JSON_BACKEND = None
+_UNPICKLER = None
+
+
+def _initJSON():
+    ''' Imports dill, registers the jsonpickle numpy handlers, and
+        builds the shared decode backend and Unpickler, once, on first use.
+    '''
+    global dill, jsonpickle, _JSON_BACKEND, _UNPICKLER
+    if jsonpickle is not None:
+        return
+    import dill as dill_module  # pylint: disable=import-outside-toplevel
+    import jsonpickle as jsonpickle_module  # pylint: disable=import-outside-toplevel
+    import jsonpickle.ext.numpy as jsonpickle_numpy  # pylint: disable=import-outside-toplevel
+    jsonpickle_numpy.register_handlers()
+    dill = dill_module
+    jsonpickle = jsonpickle_module
+    # Decode through ujson when available, on a backend object private
+    # to this module. The global jsonpickle backend must stay on stdlib
+    # json: LabState hashes its files over those exact bytes, so
+    # flipping it would invalidate every previously saved labstate.
+    _JSON_BACKEND = jsonpickle.backend.JSONBackend()
+    try:
+        import ujson  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        pass  # stdlib json decodes fine, ujson is just faster
+    else:
+        # the JSONBackend constructor already loaded ujson if importable
+        _JSON_BACKEND.set_preferred_backend('ujson')
+    # Building an Unpickler re-registers all the handlers; reset=True on
+    # restore makes it safe to share one across calls
+    _UNPICKLER = jsonpickle.unpickler.Unpickler(backend=_JSON_BACKEND, safe=True, keys=True)
+
+_visaClassCache = {}
+
+
+def _isVisaClass(klass):
+    ''' Whether ``klass`` is ``VISAObject`` or descends from it,
+        decided by class name so the hardware modules need not be imported.
+        Memoized because the MRO scan runs once per attribute per pickle.
+    '''
+    try:
+        return _visaClassCache[klass]
+    except KeyError:
+        isVisa = any(base.__name__ == 'VISAObject' for base in klass.mro())
+        _visaClassCache[klass] = isVisa
+        return isVisa
+
 
 class HardwareReference(object):
     ''' Spoofs an instrument
@@ -55,22 +103,34 @@ class JSONpickleable(Hashable):
     '''
     notPickled = set()
 
+    @classmethod
+    def _allNotPickled(cls):
+        ''' Union of ``notPickled`` over the whole MRO.
+
+            Computed once per class and cached on the class itself
+            (``cls.__dict__`` so subclasses don't inherit a stale cache).
+        '''
+        cached = cls.__dict__.get('_cached_notPickled')
+        if cached is None:
+            cached = set()
+            for base in cls.mro():
+                # notPickled may be declared as any iterable of names
+                cached.update(getattr(base, 'notPickled', ()))
+            cls._cached_notPickled = cached
+        return cached
+
     def __getstate__(self):
         '''
         This method removes all variables in ``notPickled`` during
         serialization.
         '''
+        _initJSON()
         state = super().__getstate__()
-        allNotPickled = self.notPickled
-        for base in type(self).mro():
-            try:
-                theirNotPickled = base.notPickled
-                allNotPickled = allNotPickled.union(theirNotPickled)
-            except AttributeError:
-                pass
+        allNotPickled = self._allNotPickled()
 
         keys_to_delete = set()
-        for key, val in state.copy().items():
+        dilled = {}
+        for key, val in state.items():
             if isinstance(key, str):
 
                 # 1. explicit removals
@@ -78,31 +138,37 @@ class JSONpickleable(Hashable):
                     keys_to_delete.add(key)
 
                 # 2. hardware placeholders
-                elif (val.__class__.__name__ == 'VISAObject' or
-                      any(base.__name__ == 'VISAObject' for base in val.__class__.mro())):
+                elif _isVisaClass(val.__class__):
                     klassname = val.__class__.__name__
                     logger.warning('Not pickling %s = %s.', key, klassname)
                     state[key] = HardwareReference('Reference to a ' + klassname)
 
                 # 3. functions that are not available in modules - saves the code text
                 elif jsonpickle.util.is_function(val) and not jsonpickle.util.is_module_function(val):
-                    state[key + '_dilled'] = dill.dumps(val)
+                    dilled[key + '_dilled'] = dill.dumps(val)
                     keys_to_delete.add(key)
 
                 # 4. double underscore attributes have already been removed
+        state.update(dilled)
         for key in keys_to_delete:
             del state[key]
         return state
 
     def __setstate__(self, state):
-        for key, val in state.copy().items():
+        _initJSON()
+        hardwareKeys = []
+        dilledKeys = []
+        for key, val in state.items():
             if isinstance(val, HardwareReference):
-                state[key] = None
-            elif key[-7:] == '_dilled':
-                state[key[:-7]] = dill.loads(val)
-                del state[key]
-
-        for a in self.notPickled:
+                hardwareKeys.append(key)
+            elif key.endswith('_dilled'):
+                dilledKeys.append(key)
+        for key in hardwareKeys:
+            state[key] = None
+        for key in dilledKeys:
+            state[key[:-7]] = dill.loads(state.pop(key))
+
+        for a in self._allNotPickled():
             state[a] = None
 
         super().__setstate__(state)
@@ -113,10 +179,10 @@ class JSONpickleable(Hashable):
 
             Also checks if the class is the right type and its attributes are correct
         '''
-        json_state = jsonpickle.json.decode(json_string)
-        context = jsonpickle.unpickler.Unpickler(backend=jsonpickle.json, safe=True, keys=True)
+        _initJSON()
+        json_state = _JSON_BACKEND.decode(json_string)
         try:
-            restored_object = context.restore(json_state, reset=True)
+            restored_object = _UNPICKLER.restore(json_state, reset=True)
         except (TypeError, AttributeError) as err:
             newm = err.args[
                 0] + '\n' + 'This is that strange jsonpickle error trying to get aDict.__name__. You might be trying to pickle a function.'
@@ -128,15 +194,21 @@ class JSONpickleable(Hashable):
                 raise TypeError('Loaded class is different than intended.\n' +
                                 'Got {}, needed {}.'.format(type(restored_object).__name__, cls.__name__))
 
-        for a in cls.notPickled:
+        for a in cls._allNotPickled():
             setattr(restored_object, a, None)
 
-        for key, val in restored_object.__dict__.copy().items():
+        hardwareKeys = []
+        dilledKeys = []
+        for key, val in restored_object.__dict__.items():
             if isinstance(val, HardwareReference):
-                setattr(restored_object, key, None)
-            elif key[-7:] == '_dilled':
-                setattr(restored_object, key[:-7], dill.loads(val))
-                delattr(restored_object, key)
+                hardwareKeys.append(key)
+            elif key.endswith('_dilled'):
+                dilledKeys.append(key)
+        for key in hardwareKeys:
+            setattr(restored_object, key, None)
+        for key in dilledKeys:
+            dilledVal = restored_object.__dict__.pop(key)
+            setattr(restored_object, key[:-7], dill.loads(dilledVal))
 
         return restored_object
 
@@ -148,13 +220,15 @@ class JSONpickleable(Hashable):
         return self._fromJSONcheck(self._toJSON())
 
     def save(self, filename):
+        _initJSON()
         rp = _makeFileExist(_endingWith(filename, '.json'))
         with open(rp, 'w') as f:
-            f.write(self._toJSON())
+            self._toJSONfile(f)
 
     @classmethod
     def load(cls, filename):
-        rp = _getFileDir(_endingWith(filename, '.json'))
+        _initJSON()
+        rp = _getFileDir(_endingWith(filename, '.json'), resolve=False)
         with open(rp, 'r') as f:
             frozen = f.read()
         return cls._fromJSONcheck(frozen)
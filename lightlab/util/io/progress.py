@@ -2,7 +2,9 @@
 
     Also contains web-based progress monitoring
 '''
+import os
 import sys
+import functools
 import numpy as np
 import time
 import socket
@@ -10,6 +12,25 @@ from pathlib import Path
 
 from .paths import projectDir, monitorDir
 
+# The served page autorefreshes every 5 seconds, so rewriting the file
+# more often than this is wasted disk traffic
+HTML_WRITE_INTERVAL = 1.0  # seconds
+
+
+@functools.lru_cache(maxsize=1)
+def _getMonitorUrl():
+    ''' Builds the monitor URL once. ``socket.getfqdn`` can block on DNS
+        and the port file never changes mid-session, so cache the result.
+    '''
+    prefix = 'http://'
+    host = socket.getfqdn().lower()
+    try:
+        with open(projectDir / '.monitorhostport', 'r') as fx:
+            port = int(fx.readline())
+    except FileNotFoundError:
+        port = 'null'
+    return prefix + host + ':' + str(port)
+
 
 def printWait(*args):
     r''' Prints your message followed by ``...``
@@ -20,9 +41,7 @@ def printWait(*args):
         Args:
             \*args (Tuple(str)): Strings that will be written
     '''
-    msg = ''
-    for a in args:
-        msg += str(a)
+    msg = ''.join(map(str, args))
     print(msg + "... ", end='')
     sys.stdout.flush()
 
@@ -35,9 +54,7 @@ def printProgress(*args):
     Args:
         *args (str, Tuple(str)): Arguments that will be written
     '''
-    msg = ''
-    for a in args:
-        msg += str(a)
+    msg = ''.join(map(str, args))
     sys.stdout.write('\b' * 1000)
     sys.stdout.flush()
     sys.stdout.write(msg)
@@ -66,8 +83,6 @@ class ProgressWriter(object):
     '''
     progFileDefault = monitorDir / 'sweep.html'
     tFmt = '%a, %d %b %Y %H:%M:%S'
-    __tagHead = None
-    __tagFoot = None
 
     def __init__(self, name, swpSize, runServer=True, stdoutPrint=False, **kwargs):  # pylint: disable=unused-argument
         '''
@@ -80,9 +95,8 @@ class ProgressWriter(object):
         if np.isscalar(swpSize):
             swpSize = [swpSize]
         self.size = np.array(swpSize)
-        self.currentPnt = np.zeros_like(self.size)
 
-        self.totalSize = np.prod(self.size)
+        self.totalSize = int(np.prod(self.size))
         self.ofTotal = 0
         self.completed = False
 
@@ -90,6 +104,13 @@ class ProgressWriter(object):
         self.printing = stdoutPrint
 
         self.startTime = time.time()  # In seconds since the epoch
+        self._lastHtmlWrite = 0.0
+
+        # The head only depends on name/autorefresh, so build both variants
+        # once here instead of on every update
+        self.__tagHeads = tuple(self.__buildTagHead(autorefresh)
+                                for autorefresh in (False, True))
+        self.__tagFoot = '</body>\n</html>\n'
 
         if self.serving:
             print('See sweep progress online at')
@@ -102,74 +123,81 @@ class ProgressWriter(object):
 
         if self.printing:
             print(self.name)
-            prntStr = ''
-            for iterDim, _ in enumerate(self.size):
-                prntStr += 'Dim-' + str(iterDim) + '...'
-            print(prntStr)
+            print(''.join('Dim-' + str(iterDim) + '...'
+                          for iterDim, _ in enumerate(self.size)))
             self.__writeStdio()
 
     @staticmethod
     def getUrl():
         ''' URL where the progress monitor will be hosted
         '''
-        prefix = 'http://'
-        host = socket.getfqdn().lower()
-        try:
-            with open(projectDir / '.monitorhostport', 'r') as fx:
-                port = int(fx.readline())
-        except FileNotFoundError:
-            port = 'null'
-        return prefix + host + ':' + str(port)
+        return _getMonitorUrl()
+
+    def __buildTagHead(self, autorefresh):
+        head = ['<!DOCTYPE html>\n',
+                '<html>\n',
+                '<head>\n',
+                '<title>',
+                'Sweep Progress Monitor',
+                '</title>\n']
+        if autorefresh:
+            head.append('<meta http-equiv="refresh" content="5" />\n')  # Autorefresh every 5 seconds
+        head.append('<body>\n')
+        head.append('<h1>' + self.name + '</h1>\n')
+        head.append(r'<hr \>\\n')
+        return ''.join(head)
 
     def __tag(self, bodytext, autorefresh=False):
         ''' Do the HTML tags '''
-        if not hasattr(self, '__tagHead') or self.__tagHead is None:
-            t = '<!DOCTYPE html>\n'
-            t += '<html>\n'
-            t += '<head>\n'
-            t += '<title>'
-            t += 'Sweep Progress Monitor'
-            t += '</title>\n'
-            if autorefresh:
-                t += '<meta http-equiv="refresh" content="5" />\n'  # Autorefresh every 5 seconds
-            t += '<body>\n'
-            t += '<h1>' + self.name + '</h1>\n'
-            t += r'<hr \>\\n'
-            self.__tagHead = t
-        if not hasattr(self, '__tagFoot') or self.__tagFoot is None:
-            t = '</body>\n'
-            t += '</html>\n'
-            self.__tagFoot = t
-        return self.__tagHead + bodytext + self.__tagFoot
+        return ''.join((self.__tagHeads[autorefresh], bodytext, self.__tagFoot))
+
+    def __writeHtmlFile(self, htmlText):
+        ''' Writes the full page to a sibling tmp file, then atomically
+            renames it over the served one, so the HTTP server never
+            reads a half-written page.
+        '''
+        tmpPath = self.filePath.with_suffix('.html.tmp')  # pylint: disable=no-member
+        tmpPath.write_bytes(htmlText.encode('utf-8'))
+        os.replace(tmpPath, self.filePath)
 
     def __writeStdioEnd(self):
         # display.clear_output(wait=True)
         print('Sweep completed!')
 
     def __writeHtmlEnd(self):
-        self.__tagHead = None
-        self.__tagFoot = None
-        body = '<h2>Sweep completed!</h2>\n'
-        body += ptag('At ' + ProgressWriter.tims(time.time()))
+        body = ''.join(('<h2>Sweep completed!</h2>\n',
+                        ptag('At ' + ProgressWriter.tims(time.time()))))
         htmlText = self.__tag(body, autorefresh=False)
-        with self.filePath.open('w') as fx:  # pylint: disable=no-member
-            fx.write(htmlText)
+        self.__writeHtmlFile(htmlText)
+
+    def _currentPnt(self):
+        ''' Decodes ``ofTotal`` into one index per sweep dimension.
+
+            Only called when a writer actually needs the point, so the
+            hot path of ``update`` stays pure integer arithmetic.
+        '''
+        pnt = len(self.size) * [0]
+        remainder = min(self.ofTotal, self.totalSize - 1)
+        for i in range(len(self.size) - 1, -1, -1):
+            remainder, pnt[i] = divmod(remainder, int(self.size[i]))
+        return pnt
 
     def __writeStdio(self):
-        prntStr = ''
+        currentPnt = self._currentPnt()
+        parts = []
         for iterDim, dimSize in enumerate(self.size):
-            of = (self.currentPnt[iterDim] + 1, dimSize)
-            prntStr += '/'.join((str(v) for v in of)) + '...'
-        print(prntStr)
+            of = (currentPnt[iterDim] + 1, dimSize)
+            parts.append('/'.join((str(v) for v in of)) + '...')
+        print(''.join(parts))
 
     def __writeHtml(self):
         # Write lines for progress in each dimension
-        body = ''
-        for i, p in enumerate(self.currentPnt):
+        parts = []
+        for i, p in enumerate(self._currentPnt()):
             dimStr = i * 'sub-' + 'dimension[' + str(i) + '] : '
             dimStr += str(p + 1) + ' of ' + str(self.size[i])
-            body += ptag(dimStr)
-        body += r'<hr \>\\n'
+            parts.append(ptag(dimStr))
+        parts.append(r'<hr \>\\n')
 
         # Calculating timing
         currentTime = time.time()
@@ -177,30 +205,31 @@ class ProgressWriter(object):
         completeRatio = (self.ofTotal + 1) / self.totalSize
         endTime = self.startTime + tSinceStart / completeRatio
 
-        body += ptag('(Start Time)           ' +
-                     ProgressWriter.tims(self.startTime))
-        body += ptag('(Latest Update)        ' +
-                     ProgressWriter.tims(currentTime))
-        body += ptag('(Expected Completion)  ' + ProgressWriter.tims(endTime))
+        parts.append(ptag('(Start Time)           ' +
+                          ProgressWriter.tims(self.startTime)))
+        parts.append(ptag('(Latest Update)        ' +
+                          ProgressWriter.tims(currentTime)))
+        parts.append(ptag('(Expected Completion)  ' + ProgressWriter.tims(endTime)))
 
         # Say where the files are hosted
-        body += ptag('This monitor service is hosted in the directory:')
-        body += ptag(str(monitorDir))
+        parts.append(ptag('This monitor service is hosted in the directory:'))
+        parts.append(ptag(str(monitorDir)))
 
         # Write to html file
         if self.serving:
-            htmlText = self.__tag(body, autorefresh=True)
-            with self.filePath.open('w') as fx:  # pylint: disable=no-member
-                fx.write(htmlText)
+            htmlText = self.__tag(''.join(parts), autorefresh=True)
+            self.__writeHtmlFile(htmlText)
+            self._lastHtmlWrite = time.time()
 
     def update(self, steps=1):
         if self.completed:
             raise Exception(
                 'This sweep has supposedly completed. Make a new object to go again')
-        for _ in range(steps):
-            self.__updateOneInternal()
+        self.ofTotal += steps
+        if self.ofTotal >= self.totalSize:
+            self.completed = True
         if not self.completed:
-            if self.serving:
+            if self.serving and time.time() - self._lastHtmlWrite >= HTML_WRITE_INTERVAL:
                 self.__writeHtml()
             if self.printing:
                 self.__writeStdio()
@@ -210,17 +239,6 @@ class ProgressWriter(object):
             if self.printing:
                 self.__writeStdioEnd()
 
-    def __updateOneInternal(self):
-        for i in range(len(self.size)):
-            if self.currentPnt[-i - 1] < self.size[-i - 1] - 1:
-                self.currentPnt[-i - 1] += 1
-                break
-            else:
-                self.currentPnt[-i - 1] = 0
-        self.ofTotal += 1
-        if self.ofTotal == self.totalSize:
-            self.completed = True
-
     @classmethod
     def tims(cls, epochTime):
         return time.strftime(cls.tFmt, time.localtime(epochTime)) + '\n'
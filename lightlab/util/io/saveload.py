@@ -1,3 +1,4 @@
+import io
 import os
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
@@ -10,15 +11,22 @@ from . import _getFileDir
 
 
 # File functions. You must set the fileDir first
+_createdDirs = set()
+
+
 def _makeFileExist(filename):
-    ''' If the file doesn't exist, touch it
+    ''' Makes sure the directory exists, so the file can be created.
+        The makedirs syscall is skipped for directories already seen;
+        the file itself is created by the subsequent open/save call.
 
         Returns:
             (Path): the fully resolved path to file
     '''
     rp = _getFileDir(filename)
-    os.makedirs(_getFileDir(), mode=0o775, exist_ok=True)
-    rp.touch()
+    fileDir = _getFileDir()
+    if fileDir not in _createdDirs:
+        os.makedirs(fileDir, mode=0o775, exist_ok=True)
+        _createdDirs.add(fileDir)
     print("Saving to file: {}".format(rp))
     return rp
 
@@ -55,6 +63,8 @@ def pprintFileDir():
             print(justified, f'io.loadPickle(\'{child.stem}\')')
         elif child.name.endswith('.gz'):
             print(justified, f'io.loadPickleGzip(\'{child.stem}\')')
+        elif child.name.endswith('.zst'):
+            print(justified, f'io.loadPickleFast(\'{child.stem}\')')
         elif child.name.endswith('.mat'):
             print(justified, f'io.loadMat(\'{child.stem}\')')
         else:
@@ -64,13 +74,14 @@ def pprintFileDir():
 
 def _endingWith(filerootname, suffix):
     ''' Makes sure input string ends with the suffix '''
-    froot = str(filerootname)
+    # exact type check: skips the str() copy in the common case where the
+    # caller already passes a str, without isinstance's subclass walk
+    froot = filerootname if type(filerootname) is str else str(filerootname)  # pylint: disable=unidiomatic-typecheck
     if suffix[0] != '.':
-        suffix = f'.{suffix}'
+        suffix = '.' + suffix
     if froot.endswith(suffix):
         return froot
-    else:
-        return froot + suffix
+    return froot + suffix
 
 
 def savePickle(filename, dataTuple):
@@ -82,12 +93,12 @@ def savePickle(filename, dataTuple):
     '''
     rp = _makeFileExist(_endingWith(filename, suffix='.pkl'))
     with rp.open('wb') as fx:
-        pickle.dump(dataTuple, fx)
+        pickle.dump(dataTuple, fx, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def loadPickle(filename):
     ''' Uses pickle '''
-    rp = _getFileDir(_endingWith(filename, suffix='.pkl'))
+    rp = _getFileDir(_endingWith(filename, suffix='.pkl'), resolve=False)
     with rp.open('rb') as fx:
         return pickle.load(fx)
 
@@ -100,17 +111,47 @@ def savePickleGzip(filename, dataTuple):
             dataTuple (tuple): tuple containing almost anything
     '''
     rp = _makeFileExist(_endingWith(filename, suffix='.gz'))
-    with gzip.open(rp, 'wb') as fx:
-        pickle.dump(dataTuple, fx)
+    # compresslevel=1 compresses numeric pickles several times faster
+    # than the default 9 for only a few percent more bytes.
+    # GzipFile compresses in many small chunks, so buffer the pickle
+    # stream going into it
+    with gzip.open(rp, 'wb', compresslevel=1) as gz, \
+            io.BufferedWriter(gz, buffer_size=2 ** 20) as fx:
+        pickle.dump(dataTuple, fx, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def loadPickleGzip(filename):
     ''' Uses pickle and then gzips the file'''
-    rp = _getFileDir(_endingWith(filename, suffix='.gz'))
+    rp = _getFileDir(_endingWith(filename, suffix='.gz'), resolve=False)
     with gzip.open(rp, 'rb') as fx:
         return pickle.load(fx)
 
 
+def savePickleFast(filename, dataTuple):
+    ''' Like :func:`savePickleGzip`, but compresses with zstandard,
+        which is several times faster than gzip on bulk numeric data.
+        Needs the optional ``zstandard`` package.
+
+        Args:
+            filename (str, Path): file to write to
+            dataTuple (tuple): tuple containing almost anything
+    '''
+    import zstandard  # pylint: disable=import-outside-toplevel
+    rp = _makeFileExist(_endingWith(filename, suffix='.zst'))
+    cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+    with rp.open('wb') as raw, cctx.stream_writer(raw) as fx:
+        pickle.dump(dataTuple, fx, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loadPickleFast(filename):
+    ''' Inverts :func:`savePickleFast` '''
+    import zstandard  # pylint: disable=import-outside-toplevel
+    rp = _getFileDir(_endingWith(filename, suffix='.zst'), resolve=False)
+    dctx = zstandard.ZstdDecompressor()
+    with rp.open('rb') as raw, dctx.stream_reader(raw) as fx:
+        return pickle.load(fx)
+
+
 def saveMat(filename, dataDict):
     ''' dataDict has keys as names you would like to appear in matlab,
         values are numpy arrays, N-D arrays, or matrices.
@@ -124,11 +165,12 @@ def loadMat(filename):
         Matlab files only store matrices. This auto-squeezes 1-dimensional matrices to arrays.
         Be careful if you are tyring to load a 1-d numpy matrix as an actual numpy matrix
     '''
-    rp = _getFileDir(_endingWith(filename, suffix='.mat'))
+    rp = _getFileDir(_endingWith(filename, suffix='.mat'), resolve=False)
     data = sio.loadmat(str(rp))
-    for k, v in data.items():
-        data[k] = np.squeeze(v)
-    return data
+    # Drop the __header__/__version__/__globals__ metadata that loadmat
+    # adds, and only squeeze actual arrays
+    return {k: np.squeeze(v) if isinstance(v, np.ndarray) else v
+            for k, v in data.items() if not k.startswith('__')}
 
 
 def saveFigure(filename, figHandle=None):
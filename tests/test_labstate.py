@@ -215,6 +215,24 @@ def test_reloadlabstate(lab):
     assert lab == lab2
 
 
+def test_stdlib_hash_compatibility(lab):
+    ''' The embedded sha256 must be computed over stdlib-json bytes.
+        Labstate files hash-stamped by older lightlab versions have to
+        keep validating even if a faster JSON backend (e.g. ujson) is
+        installed, so pin the byte-for-byte contract here.
+    '''
+    with open(filename, 'r') as fx:
+        json_state = json.loads(fx.read())
+    for metaKey in ("__user__", "__datetime__"):
+        json_state.pop(metaKey)
+    sha256 = json_state.pop("__sha256__")
+    stdlibEncoded = json.dumps(json_state, sort_keys=True, indent=4)
+    assert sha256 == labstate.hash_sha256(stdlibEncoded)
+    # the full load path, including hash validation, must also accept it
+    lab2 = labstate.LabState.loadState(filename=filename)
+    assert lab2.__sha256__ == sha256
+
+
 def test_instrument_method_from_frozen(lab):
     lab2 = labstate.LabState.loadState(filename=filename)
     keithley = lab2.instruments_dict["keithley1"]